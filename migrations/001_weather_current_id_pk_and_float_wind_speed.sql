@@ -0,0 +1,31 @@
+-- Upgrade an existing weather_current table to the current model.
+--
+-- The application only runs Base.metadata.create_all() at startup, which
+-- creates missing tables but never alters existing ones. Databases created
+-- from the old model (collection_time primary key, no id column, numeric
+-- wind_speed) must apply this script once before deploying a build that
+-- includes the id primary key and Float wind_speed changes:
+--
+--     psql "$DATABASE_URL" -f migrations/001_weather_current_id_pk_and_float_wind_speed.sql
+--
+-- Fresh databases need nothing; create_all() builds the new schema directly.
+
+BEGIN;
+
+-- Replace the collection_time primary key with an auto-incrementing id.
+ALTER TABLE weather_current DROP CONSTRAINT IF EXISTS weather_current_pkey;
+ALTER TABLE weather_current ADD COLUMN IF NOT EXISTS id SERIAL PRIMARY KEY;
+ALTER TABLE weather_current ALTER COLUMN collection_time SET NOT NULL;
+
+-- wind_speed: arbitrary-precision numeric -> double precision (float8).
+ALTER TABLE weather_current
+    ALTER COLUMN wind_speed TYPE double precision
+    USING wind_speed::double precision;
+
+-- Descending covering index used by the keyset-paginated list endpoint.
+CREATE INDEX IF NOT EXISTS ix_weather_ct_desc
+    ON weather_current (collection_time DESC)
+    INCLUDE (id, temperature, temperature_min, temperature_max, humidity,
+             description, feels_like, wind_speed, wind_direction);
+
+COMMIT;
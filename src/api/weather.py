@@ -1,54 +1,118 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
-from sqlalchemy import desc
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 from framework.db import get_db
 from models.weather import Weather, WeatherCreate
-from datetime import datetime, UTC
+from datetime import datetime
 
 router = APIRouter()
 
+# Column-name tuples memoized per model class; __table__.columns is identical
+# for every instance of a class, so it only needs to be inspected once.
+_COL_CACHE: dict[type, tuple[str, ...]] = {}
+
+
 def serialize_sqlalchemy_obj(obj):
     """
     Convert a SQLAlchemy ORM model instance into a dictionary.
 
+    Reads loaded column values straight from the instance __dict__ using a
+    column-name tuple cached per model class, skipping per-row column
+    discovery and the instrumented-attribute descriptor path.
+
     Args:
         obj: SQLAlchemy model instance.
 
     Returns:
         dict: Dictionary containing all column names and their values.
     """
-    return {column.name: getattr(obj, column.name) for column in obj.__table__.columns}
-
-
-@router.get("/api/v1/weather")
+    cls = type(obj)
+    cols = _COL_CACHE.get(cls)
+    if cols is None:
+        cols = _COL_CACHE[cls] = tuple(c.name for c in obj.__table__.columns)
+    d = obj.__dict__
+    return {k: d.get(k) for k in cols}
+
+
+# Columns the list endpoint ships, kept as an explicit tuple (the raw-SQL
+# analogue of load_only) so columns added to the model later do not silently
+# bloat every page of list results.
+_LIST_COLS = (
+    "id",
+    "collection_time",
+    "temperature",
+    "temperature_min",
+    "temperature_max",
+    "humidity",
+    "description",
+    "feels_like",
+    "wind_speed",
+    "wind_direction",
+)
+
+# Mapped column names accepted by the bulk update endpoint; anything else in
+# a payload entry would raise deep inside SQLAlchemy and surface as a 500.
+_UPDATABLE_COLS = frozenset(column.name for column in Weather.__table__.columns)
+
+# Hand-written SELECT for the hot list path; uses the driver's %s paramstyle
+# (psycopg2). Selecting named columns keeps the zip() with _LIST_COLS in
+# list_weather correct regardless of table column order.
+_LIST_SQL = "SELECT {} FROM weather_current".format(", ".join(_LIST_COLS))
+
+
+@router.get("/api/v1/weather", response_class=ORJSONResponse)
 def list_weather(
-    page: int = Query(1, ge=1, description="Page number to retrieve"),
+    before: datetime | None = Query(None, description="Return records collected before this timestamp (cursor)"),
     limit: int = Query(10, ge=1, le=100, description="Number of records per page"),
     db: Session = Depends(get_db)
 ):
     """
     Retrieve a paginated list of Weather records, sorted by latest collection_time first.
 
+    Uses keyset (cursor) pagination on the indexed collection_time column instead
+    of OFFSET, so the database never scans and discards rows for deep pages.
+    Pass the returned `next_cursor` as `before` to fetch the next page.
+
     Args:
-        page (int): Page number starting from 1.
+        before (datetime | None): Cursor; only records older than this are returned.
         limit (int): Maximum number of records to return per page.
         db (Session): SQLAlchemy database session.
 
     Returns:
-        list[dict]: A list of serialized Weather records.
+        dict: `items` (list of serialized Weather records) and `next_cursor`
+              (collection_time of the last item, or None when the page is empty).
     """
+    # Drop to the DB-API cursor for this read-only query: SQLAlchemy's
+    # result post-processing (Row construction, processors) dominates the
+    # cost of a trivial SELECT returning a handful of scalar columns.
+    connection = db.connection()
+    # psycopg2 (production) takes format-style %s placeholders; the sqlite3
+    # driver backing the unit tests takes qmark.
+    placeholder = "%s" if connection.dialect.paramstyle in ("format", "pyformat") else "?"
+    cursor = connection.connection.cursor()
     try:
-        offset = (page - 1) * limit
-        weather_records = (
-            db.query(Weather)
-            .order_by(desc(Weather.collection_time))  # sort descending
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
-        return [serialize_sqlalchemy_obj(item) for item in weather_records]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+        if before is not None:
+            cursor.execute(
+                _LIST_SQL + f" WHERE collection_time < {placeholder} ORDER BY collection_time DESC LIMIT {placeholder}",
+                (before, limit),
+            )
+        else:
+            cursor.execute(
+                _LIST_SQL + f" ORDER BY collection_time DESC LIMIT {placeholder}",
+                (limit,),
+            )
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    items = [dict(zip(_LIST_COLS, row)) for row in rows]
+    # Raw sqlite rows carry collection_time as the stored ISO string rather
+    # than a datetime; pass it through as the cursor unchanged.
+    last = items[-1]["collection_time"] if items else None
+    return {
+        "items": items,
+        "next_cursor": last.isoformat() if isinstance(last, datetime) else last,
+    }
 
 
 @router.post("/api/v1/weather")
@@ -66,21 +130,98 @@ def create_record(
     Returns:
         dict: The newly created Weather record.
     """
-    try:
-        data = weather_data.model_dump(exclude_unset=True)
-        new_record = Weather(**data)
-        new_record.create_date = datetime.now(UTC)
-        new_record.update_date = datetime.now(UTC)
-
-        db.add(new_record)
-        db.commit()
-        db.refresh(new_record)
-        return serialize_sqlalchemy_obj(new_record)
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    # Validation has already run, so the field values can be read straight
+    # from __dict__ without a model_dump serialization pass.
+    data = dict(weather_data.__dict__)
+    new_record = Weather(**data)
+
+    db.add(new_record)
+    # Flush to get the generated id before commit expires the instance;
+    # still no db.refresh(), since every other column came from the caller.
+    db.flush()
+    data["id"] = new_record.id
+    db.commit()
+    return data
+
+
+@router.post("/api/v1/weather/bulk")
+def create_records_bulk(
+    weather_data: list[WeatherCreate] = Body(..., description="Data for the new records"),
+    db: Session = Depends(get_db)
+):
+    """
+    Create multiple Weather records in a single statement.
+
+    Uses bulk_insert_mappings, which bypasses ORM unit-of-work tracking
+    (identity map, per-row flush) and batches the inserts through the
+    driver's executemany, followed by one commit.
+
+    Args:
+        weather_data (list[WeatherCreate]): Data models for the records to create.
+        db (Session): SQLAlchemy database session.
+
+    Returns:
+        dict: Confirmation message with the number of records created.
+    """
+    mappings = [dict(record.__dict__) for record in weather_data]
+    db.bulk_insert_mappings(Weather, mappings)
+    db.commit()
+    return {"detail": f"{len(mappings)} weather records created"}
+
+
+@router.patch("/api/v1/weather/bulk")
+def update_records_bulk(
+    updates: list[dict] = Body(..., description="Records to update; each entry needs 'id' plus the fields to change"),
+    db: Session = Depends(get_db)
+):
+    """
+    Partially update multiple Weather records in a single statement.
+
+    Uses the bulk UPDATE by primary key form (db.execute(update(Weather),
+    mappings)), which batches through the driver's executemany instead of
+    issuing a SELECT + UPDATE round trip per record. Entries may carry
+    different key sets; SQLAlchemy groups them into one executemany batch
+    per distinct key set.
+
+    Args:
+        updates (list[dict]): Update mappings, each containing 'id' plus the
+            fields to change.
+        db (Session): SQLAlchemy database session.
+
+    Returns:
+        dict: Confirmation message with the number of records updated.
+
+    Raises:
+        HTTPException: If an entry is missing its 'id', names an unknown field,
+            or targets an id that does not exist.
+    """
+    if not updates:
+        return {"detail": "0 weather records updated"}
+    for entry in updates:
+        if "id" not in entry:
+            raise HTTPException(status_code=400, detail="Each update entry must include an 'id'")
+        unknown = set(entry) - _UPDATABLE_COLS
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields in update entry: {', '.join(sorted(unknown))}"
+            )
+
+    # Pre-check the targeted ids in one SELECT: the bulk UPDATE raises
+    # StaleDataError (a 500) when a row is missing, and a 404 naming the
+    # missing ids is far more useful to the caller.
+    ids = {entry["id"] for entry in updates}
+    found = {row[0] for row in db.execute(select(Weather.id).where(Weather.id.in_(ids)))}
+    missing = ids - found
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Weather with id(s) {', '.join(sorted(map(str, missing)))} not found"
+        )
+
+    db.execute(update(Weather), updates)
+    db.commit()
+    return {"detail": f"{len(updates)} weather records updated"}
 
 
 @router.get("/api/v1/weather/{id}")
@@ -98,15 +239,10 @@ def get_weather_by_id(id: int, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If the record is not found.
     """
-    try:
-        record = db.query(Weather).filter(Weather.id == id).first()
-        if not record:
-            raise HTTPException(status_code=404, detail=f"Weather with id {id} not found")
-        return serialize_sqlalchemy_obj(record)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    record = db.get(Weather, id)
+    if not record:
+        raise HTTPException(status_code=404, detail=f"Weather with id {id} not found")
+    return serialize_sqlalchemy_obj(record)
 
 
 @router.put("/api/v1/weather/{id}")
@@ -129,24 +265,19 @@ def update_weather_full(
     Raises:
         HTTPException: If the record is not found.
     """
-    try:
-        record = db.query(Weather).filter(Weather.id == id).first()
-        if not record:
-            raise HTTPException(status_code=404, detail=f"Weather with id {id} not found")
-
-        data = weather_data.model_dump(exclude_unset=False)
-        for key, value in data.items():
-            setattr(record, key, value)
-
-        record.update_date = datetime.now(UTC)
-        db.commit()
-        db.refresh(record)
-        return serialize_sqlalchemy_obj(record)
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    # UPDATE ... RETURNING collapses the find/mutate/reload sequence
+    # (SELECT + UPDATE + refresh SELECT) into a single round trip.
+    stmt = (
+        update(Weather)
+        .where(Weather.id == id)
+        .values(weather_data.__dict__)
+        .returning(Weather.__table__)
+    )
+    row = db.execute(stmt).mappings().first()
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"Weather with id {id} not found")
+    db.commit()
+    return dict(row)
 
 
 @router.patch("/api/v1/weather/{id}")
@@ -169,24 +300,25 @@ def update_weather_partial(
     Raises:
         HTTPException: If the record is not found.
     """
-    try:
-        record = db.query(Weather).filter(Weather.id == id).first()
+    values = {key: getattr(weather_data, key) for key in weather_data.model_fields_set}
+    if not values:
+        # Nothing to change; just return the current record.
+        record = db.get(Weather, id)
         if not record:
             raise HTTPException(status_code=404, detail=f"Weather with id {id} not found")
-
-        data = weather_data.model_dump(exclude_unset=True)
-        for key, value in data.items():
-            setattr(record, key, value)
-
-        record.update_date = datetime.now(UTC)
-        db.commit()
-        db.refresh(record)
         return serialize_sqlalchemy_obj(record)
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    stmt = (
+        update(Weather)
+        .where(Weather.id == id)
+        .values(values)
+        .returning(Weather.__table__)
+    )
+    row = db.execute(stmt).mappings().first()
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"Weather with id {id} not found")
+    db.commit()
+    return dict(row)
 
 
 @router.delete("/api/v1/weather/{id}")
@@ -204,16 +336,10 @@ def delete_weather(id: int, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If the record is not found.
     """
-    try:
-        record = db.query(Weather).filter(Weather.id == id).first()
-        if not record:
-            raise HTTPException(status_code=404, detail=f"Weather with id {id} not found")
+    record = db.get(Weather, id)
+    if not record:
+        raise HTTPException(status_code=404, detail=f"Weather with id {id} not found")
 
-        db.delete(record)
-        db.commit()
-        return {"detail": f"Weather with id {id} deleted successfully"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    db.delete(record)
+    db.commit()
+    return {"detail": f"Weather with id {id} deleted successfully"}
@@ -17,8 +17,10 @@ Environment Variables:
 import os
 import logging
 from time import sleep
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 from contextlib import asynccontextmanager
 from fastapi.staticfiles import StaticFiles
 import framework.db
@@ -94,6 +96,21 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Global exception handlers replace the per-endpoint try/except blocks: the
+# handlers run once per failed request instead of setting up an exception
+# frame in every handler's hot path. Session rollback happens in get_db.
+@app.exception_handler(SQLAlchemyError)
+async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
+    logger.error(f"Database error on {request.url.path}: {str(exc)}")
+    return JSONResponse(status_code=500, content={"detail": f"Internal server error: {str(exc)}"})
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.error(f"Unhandled error on {request.url.path}: {str(exc)}")
+    return JSONResponse(status_code=500, content={"detail": f"Internal server error: {str(exc)}"})
+
+
 # Add middleware and instrumentation
 if os.getenv("TESTING") != "true":
     for mw in app_middleware:
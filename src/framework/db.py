@@ -14,7 +14,7 @@ Environment Variables for Production:
     POSTGRES_DB       - Database name
     DB_POOL_SIZE      - SQLAlchemy pool size (default: 10)
     DB_MAX_OVERFLOW   - Max overflow connections beyond pool_size (default: 20)
-    DB_POOL_RECYCLE   - Connection lifetime in seconds before recycling (default: 3600)
+    DB_POOL_RECYCLE   - Connection lifetime in seconds before recycling (default: 1800)
 
 Environment Variables for Testing:
     DATABASE_URL - Full SQLAlchemy database URL (e.g., sqlite:///./test.db)
@@ -98,12 +98,15 @@ def init_db(database_url: str = None, **engine_kwargs):
                     f"{required_keys['POSTGRES_DB']}"
                 )
 
-                # Default production pool config
+                # Default production pool config. LIFO checkout keeps a small
+                # hot set of connections warm (better server-side plan cache
+                # reuse) and lets idle overflow connections age out and close.
                 pool_config = {
                     "pool_pre_ping": True,
+                    "pool_use_lifo": True,
                     "pool_size": int(os.getenv("DB_POOL_SIZE", 10)),
                     "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 20)),
-                    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 3600))
+                    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800))
                 }
                 pool_config.update(engine_kwargs)
             else:
@@ -156,5 +159,10 @@ def get_db():
     db = SessionLocal()
     try:
         yield db
+    except Exception:
+        # Endpoints no longer wrap their bodies in try/except; roll back
+        # here so the global exception handlers see a clean session.
+        db.rollback()
+        raise
     finally:
         db.close()
@@ -6,10 +6,10 @@ This module defines:
 - The Pydantic schema for validating API requests when creating a Weather record.
 """
 
-from sqlalchemy import Column, DateTime, Integer, String, Numeric
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String
 from framework.db import Base
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
@@ -18,33 +18,60 @@ class Weather(Base):
     SQLAlchemy ORM model representing a current weather record.
 
     Attributes:
-        collection_time (datetime): Primary key, timestamp when data was collected.
+        id (int): Primary key, auto-incrementing record identifier.
+        collection_time (datetime): Timestamp when data was collected (indexed).
         temperature (int | None): Current temperature in degrees.
         temperature_min (int | None): Minimum temperature.
         temperature_max (int | None): Maximum temperature.
         humidity (int | None): Humidity percentage.
         description (str | None): Weather description (up to 200 characters).
         feels_like (int | None): Feels-like temperature.
-        wind_speed (Decimal | None): Wind speed.
+        wind_speed (float | None): Wind speed.
         wind_direction (int | None): Wind direction in degrees.
     """
 
     __tablename__ = "weather_current"
 
-    collection_time = Column(DateTime(timezone=True), primary_key=True, nullable=False)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    collection_time = Column(DateTime(timezone=True), nullable=False)
     temperature = Column(Integer, nullable=True)
     temperature_min = Column(Integer, nullable=True)
     temperature_max = Column(Integer, nullable=True)
     humidity = Column(Integer, nullable=True)
     description = Column(String(200), nullable=True)
     feels_like = Column(Integer, nullable=True)
-    wind_speed = Column(Numeric, nullable=True)
+    wind_speed = Column(Float, nullable=True)
     wind_direction = Column(Integer, nullable=True)
 
+    # Descending index matching the list endpoint's ORDER BY, with the
+    # remaining columns INCLUDEd so PostgreSQL can answer the paginated
+    # list with an index-only scan (no heap fetches).
+    __table_args__ = (
+        Index(
+            "ix_weather_ct_desc",
+            collection_time.desc(),
+            postgresql_include=[
+                "id",
+                "temperature",
+                "temperature_min",
+                "temperature_max",
+                "humidity",
+                "description",
+                "feels_like",
+                "wind_speed",
+                "wind_direction",
+            ],
+        ),
+    )
+
     def __repr__(self):
+        # Read from __dict__ so repr (e.g. in log statements or tracebacks)
+        # skips the instrumented-attribute path and never triggers a lazy
+        # load on an expired or detached instance.
+        d = self.__dict__
         return (
-            f"<WeatherCurrent(collection_time={self.collection_time}, "
-            f"temp={self.temperature}, humidity={self.humidity}, desc='{self.description}')>"
+            f"<WeatherCurrent(collection_time={d.get('collection_time')}, "
+            f"temp={d.get('temperature')}, humidity={d.get('humidity')}, desc='{d.get('description')}')>"
         )
 
 
@@ -65,6 +92,15 @@ class WeatherCreate(BaseModel):
             "wind_direction": 180
         }
     """
+    # from_attributes lets model_validate read ORM instances directly;
+    # validate_assignment stays off so post-validation writes skip the
+    # validator; unknown payload keys are dropped rather than rejected.
+    model_config = ConfigDict(
+        from_attributes=True,
+        validate_assignment=False,
+        extra="ignore",
+    )
+
     collection_time: datetime
     temperature: Optional[int] = None
     temperature_min: Optional[int] = None
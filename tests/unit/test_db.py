@@ -37,9 +37,10 @@ def test_init_db_success(monkeypatch):
         mock_engine.assert_called_once_with(
             expected_url,
             pool_pre_ping=True,
+            pool_use_lifo=True,
             pool_size=10,
             max_overflow=20,
-            pool_recycle=3600
+            pool_recycle=1800
         )
         assert db.SessionLocal is not None
         assert db.engine is not None
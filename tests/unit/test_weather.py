@@ -0,0 +1,146 @@
+from datetime import datetime, timedelta, UTC
+
+
+def _payload(collection_time, temperature=70):
+    return {
+        "collection_time": collection_time.isoformat(),
+        "temperature": temperature,
+        "humidity": 50,
+        "description": "Clear skies",
+        "wind_speed": 5.5,
+    }
+
+
+def test_create_and_get_weather(client):
+    """Test creating a record and fetching it back by id."""
+    response = client.post("/api/v1/weather", json=_payload(datetime(2025, 9, 19, 14, tzinfo=UTC)))
+    assert response.status_code == 200
+    created = response.json()
+    assert created["id"] is not None
+    assert created["temperature"] == 70
+
+    response = client.get(f"/api/v1/weather/{created['id']}")
+    assert response.status_code == 200
+    assert response.json()["temperature"] == 70
+
+
+def test_get_weather_not_found(client):
+    """Test that an unknown id returns 404."""
+    response = client.get("/api/v1/weather/999999")
+    assert response.status_code == 404
+
+
+def test_list_weather_pages_with_cursor(client):
+    """Test the list endpoint's keyset pagination end to end."""
+    # Far-future timestamps so these records sort ahead of anything else.
+    base = datetime(2030, 1, 1, 12, tzinfo=UTC)
+    for i in range(5):
+        response = client.post("/api/v1/weather", json=_payload(base + timedelta(hours=i), temperature=i))
+        assert response.status_code == 200
+
+    response = client.get("/api/v1/weather", params={"limit": 3})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["temperature"] for item in data["items"]] == [4, 3, 2]
+    assert data["next_cursor"] is not None
+
+    response = client.get("/api/v1/weather", params={"limit": 3, "before": data["next_cursor"]})
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["temperature"] for item in data["items"][:2]] == [1, 0]
+
+
+def test_update_weather_full(client):
+    """Test PUT replaces a record and 404s on an unknown id."""
+    created = client.post("/api/v1/weather", json=_payload(datetime(2025, 9, 20, 9, tzinfo=UTC))).json()
+
+    response = client.put(
+        f"/api/v1/weather/{created['id']}",
+        json=_payload(datetime(2025, 9, 20, 10, tzinfo=UTC), temperature=85),
+    )
+    assert response.status_code == 200
+    assert response.json()["temperature"] == 85
+
+    response = client.put(
+        "/api/v1/weather/999999",
+        json=_payload(datetime(2025, 9, 20, 11, tzinfo=UTC)),
+    )
+    assert response.status_code == 404
+
+
+def test_update_weather_partial(client):
+    """Test PATCH updates only the provided fields."""
+    created = client.post(
+        "/api/v1/weather",
+        json=_payload(datetime(2025, 9, 21, 9, tzinfo=UTC), temperature=60),
+    ).json()
+
+    response = client.patch(
+        f"/api/v1/weather/{created['id']}",
+        json={"collection_time": created["collection_time"], "temperature": 61},
+    )
+    assert response.status_code == 200
+    updated = response.json()
+    assert updated["temperature"] == 61
+    assert updated["description"] == "Clear skies"
+
+
+def test_delete_weather(client):
+    """Test deleting a record and that it is gone afterwards."""
+    created = client.post("/api/v1/weather", json=_payload(datetime(2025, 9, 22, 9, tzinfo=UTC))).json()
+
+    response = client.delete(f"/api/v1/weather/{created['id']}")
+    assert response.status_code == 200
+
+    assert client.get(f"/api/v1/weather/{created['id']}").status_code == 404
+    assert client.delete(f"/api/v1/weather/{created['id']}").status_code == 404
+
+
+def test_create_records_bulk(client):
+    """Test bulk create inserts all records in one request."""
+    base = datetime(2025, 9, 23, 9, tzinfo=UTC)
+    response = client.post(
+        "/api/v1/weather/bulk",
+        json=[_payload(base, temperature=10), _payload(base + timedelta(hours=1), temperature=11)],
+    )
+    assert response.status_code == 200
+    assert response.json() == {"detail": "2 weather records created"}
+
+
+def test_update_records_bulk(client):
+    """Test bulk partial update applies each entry's fields."""
+    base = datetime(2025, 9, 24, 9, tzinfo=UTC)
+    first = client.post("/api/v1/weather", json=_payload(base)).json()
+    second = client.post("/api/v1/weather", json=_payload(base + timedelta(hours=1))).json()
+
+    response = client.patch(
+        "/api/v1/weather/bulk",
+        json=[
+            {"id": first["id"], "temperature": 100},
+            {"id": second["id"], "temperature": 101, "humidity": 60},
+        ],
+    )
+    assert response.status_code == 200
+    assert response.json() == {"detail": "2 weather records updated"}
+
+    assert client.get(f"/api/v1/weather/{first['id']}").json()["temperature"] == 100
+    updated = client.get(f"/api/v1/weather/{second['id']}").json()
+    assert updated["temperature"] == 101
+    assert updated["humidity"] == 60
+
+
+def test_update_records_bulk_validation(client):
+    """Test the bulk update 400/404 paths."""
+    created = client.post("/api/v1/weather", json=_payload(datetime(2025, 9, 25, 9, tzinfo=UTC))).json()
+
+    response = client.patch("/api/v1/weather/bulk", json=[{"temperature": 50}])
+    assert response.status_code == 400
+    assert "id" in response.json()["detail"]
+
+    response = client.patch("/api/v1/weather/bulk", json=[{"id": created["id"], "temp": 50}])
+    assert response.status_code == 400
+    assert "temp" in response.json()["detail"]
+
+    response = client.patch("/api/v1/weather/bulk", json=[{"id": 999999, "temperature": 50}])
+    assert response.status_code == 404
+    assert "999999" in response.json()["detail"]